@@ -6,6 +6,7 @@ from multiprocessing import Pool
 
 from organisms.Genome import Genome
 from organisms.Nuclei import Nuclei
+from organisms.PopulationEngine import PopulationEngine
 from organisms.innovation import GlobalInnovations
 
 
@@ -40,7 +41,7 @@ class Evaluator:
 
     def __init__(self, inputs, outputs, population,
                  connectionMutationRate, nodeMutationRate, weightMutationRate,
-                 weightPerturbRate, selectionPressure):
+                 weightPerturbRate, selectionPressure, activation='softmax'):
         # hyperparameters
         self.connectionMutationRate = connectionMutationRate
         self.nodeMutationRate = nodeMutationRate
@@ -55,7 +56,7 @@ class Evaluator:
         self.nuclei = Nuclei()
         self.standing = Pool(processes=200)
 
-        seed = Genome.initial(inputs, outputs, self.globalInnovations)
+        seed = Genome.initial(inputs, outputs, self.globalInnovations, activation)
         massSpawner = partial(massSpawn, seed)
 
         # with Pool() as divers:
@@ -213,5 +214,17 @@ class Evaluator:
         #         return self.genepool.index(ge)
         # return rand.randint(0, len(self.genepool) - 1)
 
+    def forwardPropPopulation(self, inputs):
+        """
+        propagate a batch of input vectors through every Genome in the genepool in
+        one array program (see PopulationEngine).
+
+        PARAMETERS:
+            inputs: array of shape [n_samples, n_inputs]
+        RETURNS:
+            array of output signals of shape [population, n_samples, n_outputs]
+        """
+        return PopulationEngine(self.genepool).forwardProp(inputs)
+
     def getMaxFitness(self):
         return max([x.fitness for x in self.genepool])
@@ -0,0 +1,50 @@
+import numpy as np
+
+from organisms.activationFunctions import getActivation
+
+
+class ForwardPlan:
+    """
+    a compiled forward propagation schedule for a Genome topology. Built once after
+    a structural change so repeated forward passes only perform arithmetic.
+
+    Parameters:
+        inputNodes: input nodes of the Genome (activated first with given signals)
+        order: hidden nodes in activation order
+        outputNodes: output nodes of the Genome (harvested last)
+        activation: name of the Genome's activation function, used for nodes
+                    without their own activation
+    Constructs:
+        incoming: {Node: [enabled incoming connections]} for every scheduled Node
+        recurrent: all enabled connections marked as loop (carry signal across passes)
+        nodeIndex: {Node: column} of every scheduled Node in batched activations
+        sources: {Node: column indices of feed forward incoming connections}
+        activations: {Node: (scalar activation, batch activation)}
+    """
+
+    def __init__(self, inputNodes, order, outputNodes, activation):
+        self.inputNodes = inputNodes
+        self.order = order
+        self.outputNodes = outputNodes
+
+        self.incoming = {}
+        self.recurrent = []
+        self.activations = {}
+        for node in inputNodes + order + outputNodes:
+            self.activations.update({node: getActivation(
+                activation if node.activation is None else node.activation)})
+            incs = [x for x in node.inConnections if x.disabled is False]
+            self.incoming.update({node: incs})
+            for inc in incs:
+                if inc.loop is True and inc not in self.recurrent:
+                    self.recurrent.append(inc)
+
+        # column layout for batched forward propagation
+        self.nodeIndex = {}
+        for node in inputNodes + order + outputNodes:
+            self.nodeIndex.update({node: len(self.nodeIndex)})
+        self.sources = {}
+        for node in order + outputNodes:
+            self.sources.update({node: np.array(
+                [self.nodeIndex[x.input] for x in self.incoming[node] if x.loop is False],
+                dtype=np.intp)})
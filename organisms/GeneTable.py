@@ -0,0 +1,84 @@
+import numpy as np
+
+from organisms.activationFunctions import activations
+
+# node types
+INPUT = 0
+OUTPUT = 1
+HIDDEN = 2
+
+ACTIVATION_NAMES = list(activations)
+
+NODE_DTYPE = np.dtype([
+    ('nodeId', np.int64),
+    ('nodeType', np.int8),
+    # position in ACTIVATION_NAMES, -1 uses the Genome's activation
+    ('activation', np.int8),
+])
+
+CONNECTION_DTYPE = np.dtype([
+    ('innovation', np.int64),
+    ('inId', np.int64),
+    ('outId', np.int64),
+    ('weight', np.float64),
+    ('disabled', np.bool_),
+    # position in input Node's outConnections and output Node's inConnections
+    # (first connections of a hidden Node are its primal connections)
+    ('inPosition', np.int32),
+    ('outPosition', np.int32),
+])
+
+
+class GeneTable:
+    # TODO: the object graph is still authoritative for genetic operations. move
+    #       mutation onto the table and keep NodeGene/ConnectionGene as views.
+    """
+    struct of arrays representation of a Genome: contiguous node and connection
+    gene arrays that can be vectorized over, pickled cheaply and rebuilt into a
+    Genome with Genome.fromGeneTable.
+
+    Parameters:
+        nodes: NODE_DTYPE array of input, output then hidden nodes in Genome order
+        connections: CONNECTION_DTYPE array sorted by innovation
+        activation: name of the Genome's activation function
+        fitness: fitness of the Genome
+    """
+
+    def __init__(self, nodes, connections, activation, fitness):
+        self.nodes = nodes
+        self.connections = connections
+        self.activation = activation
+        self.fitness = fitness
+
+    @classmethod
+    def fromGenome(cls, genome):
+        """
+        flatten a Genome's object graph into a GeneTable
+        """
+        nodes = []
+        inPositions, outPositions = {}, {}
+        for nodeType, nodeList in ((INPUT, genome.inputNodes), (OUTPUT, genome.outputNodes),
+                                   (HIDDEN, genome.hiddenNodes)):
+            for node in nodeList:
+                nodes.append((node.nodeId, nodeType, -1 if node.activation is None
+                              else ACTIVATION_NAMES.index(node.activation)))
+                for position, outc in enumerate(node.outConnections):
+                    inPositions.update({outc: position})
+                for position, inc in enumerate(node.inConnections):
+                    outPositions.update({inc: position})
+        nodes = np.array(nodes, dtype=NODE_DTYPE)
+
+        connections = np.array(
+            [(x.innovation, x.input.nodeId, x.output.nodeId, x.weight, x.disabled,
+              inPositions[x], outPositions[x]) for x in genome.getAllConnections()],
+            dtype=CONNECTION_DTYPE)
+        connections.sort(order='innovation', kind='stable')
+
+        return cls(nodes, connections, genome.activation, genome.fitness)
+
+    @property
+    def nbytes(self):
+        """
+        bytes held by the gene arrays
+        """
+        return self.nodes.nbytes + self.connections.nbytes
@@ -2,9 +2,13 @@ import logging
 import random as rand
 from math import sqrt
 
+import numpy as np
+
 from organisms.ConnectionGene import ConnectionGene as Connection
+from organisms.ForwardPlan import ForwardPlan
+from organisms.GeneTable import ACTIVATION_NAMES, GeneTable, INPUT, OUTPUT
 from organisms.NodeGene import NodeGene as Node
-from organisms.activationFunctions import softmax
+from organisms.PopulationEngine import PopulationEngine
 
 
 # from organisms.network import processSequences
@@ -27,21 +31,19 @@ class Genome:
         inputSize: integer size of input nodes
         outputSize: integer size of output nodes
         globalInnovations: list of all connections to keep things consistent
+        activation: name of the activation function (see activationFunctions)
     Constructs:
         a fully connected topology of given input and output dimensions with random
         initial weights
     """
 
-    def __init__(self, inputSize, outputSize, globalInnovations):
+    def __init__(self, inputSize, outputSize, globalInnovations, activation='softmax'):
         # TODO: I don't like spawn's overloading for initialization. rewrite.
         # this is all due to initialization of nodeId in globalInnovation
         """
         create a child Genome without checking nodeId globalInnovation
         """
-        self.inputNodes = []
-        self.outputNodes = []
-        self.hiddenNodes = []
-        self.fitness = 0
+        self.initializeGenes(activation)
         initNodeId = 0
 
         for newNode in range(0, inputSize):
@@ -60,7 +62,7 @@ class Genome:
     # TODO: I dont like this.. think of a way to clean this up a little.
     #       This breaks passed in globalInnovation
     @classmethod
-    def initial(cls, inputSize, outputSize, globalInnovations):
+    def initial(cls, inputSize, outputSize, globalInnovations, activation='softmax'):
         """
         spawn initial genomes for genepool (sets nodeId based on initial topology)
         """
@@ -73,7 +75,63 @@ class Genome:
             initNodeId = inputSize + outputSize
             globalInnovations.nodeId = initNodeId
 
-        return cls(inputSize, outputSize, globalInnovations)
+        return cls(inputSize, outputSize, globalInnovations, activation)
+
+    def initializeGenes(self, activation):
+        """
+        set up an empty topology
+        """
+        self.inputNodes = []
+        self.outputNodes = []
+        self.hiddenNodes = []
+        self.fitness = 0
+        self.activation = activation
+        # compiled forward propagation, rebuilt after structural changes
+        self.forwardPlan = None
+
+    def geneTable(self):
+        """
+        get the struct of arrays (GeneTable) representation of this Genome
+        """
+        return GeneTable.fromGenome(self)
+
+    @classmethod
+    def fromGeneTable(cls, table):
+        """
+        rebuild a Genome's object graph from its GeneTable representation, preserving
+        Node and Connection order (and therefore primal connections).
+        """
+        genome = cls.__new__(cls)
+        genome.initializeGenes(table.activation)
+        genome.fitness = table.fitness
+
+        nodes = {}
+        for nodeId, nodeType, activation in table.nodes.tolist():
+            node = Node(nodeId)
+            if activation >= 0:
+                node.activation = ACTIVATION_NAMES[activation]
+            nodes.update({nodeId: node})
+            if nodeType == INPUT:
+                genome.inputNodes.append(node)
+            elif nodeType == OUTPUT:
+                genome.outputNodes.append(node)
+            else:
+                genome.hiddenNodes.append(node)
+
+        positions = {}
+        for innovation, inId, outId, weight, disabled, inPosition, outPosition \
+                in table.connections.tolist():
+            newConnection = Connection(weight, nodes[inId], nodes[outId])
+            newConnection.innovation = innovation
+            newConnection.disabled = disabled
+            positions.update({newConnection: (inPosition, outPosition)})
+
+        for node in nodes.values():
+            node.outConnections.sort(key=lambda x: positions[x][0])
+            node.inConnections.sort(key=lambda x: positions[x][1])
+
+        genome.resetLoops()
+        return genome
 
     def getNode(self, nodeId):
         """
@@ -295,11 +353,23 @@ class Genome:
         self.resetSignals()
 
     # FORWARD PROPAGATION SPECIFIC OPERATIONS  #
+    def setActivation(self, activation, node=None):
+        """
+        select the activation function of this Genome or, if node is given, of a
+        single Node (None reverts the Node to the Genome's activation).
+        """
+        if node is None:
+            self.activation = activation
+        else:
+            node.activation = activation
+        self.forwardPlan = None
+
     def resetLoops(self):
         """
         resets all connections in this Genome to Connection.loop = False
-        unless obvious recursion (input is output)
+        unless obvious recursion (input is output). invalidates the ForwardPlan.
         """
+        self.forwardPlan = None
         # reset all loops from previous topology
         for node in self.inputNodes + self.outputNodes + self.hiddenNodes:
             for connect in node.inConnections + node.outConnections:
@@ -326,82 +396,148 @@ class Genome:
         for activeNode in self.inputNodes + self.outputNodes + self.hiddenNodes:
             activeNode.activated = False
 
+    def compilePlan(self):
+        """
+        build the ForwardPlan for this topology. loop connections are classified once
+        as the back edges of a depth first search from the input layer (then any
+        unreached hidden nodes), which leaves the remaining connections acyclic so
+        their reverse postorder is the activation order. Deterministic for a given
+        topology and cached until the next structural change (see resetLoops).
+        """
+        visiting, finished = set(), set()
+        postorder = []
+
+        def enabledOutConnections(node):
+            return iter([x for x in node.outConnections if x.disabled is False])
+
+        for root in self.inputNodes + self.hiddenNodes:
+            if root in visiting or root in finished:
+                continue
+            visiting.add(root)
+            # iterative to keep deep genomes clear of the recursion limit
+            stack = [(root, enabledOutConnections(root))]
+            while len(stack) > 0:
+                node, outConnections = stack[-1]
+                for outc in outConnections:
+                    step = outc.output
+                    # a Connection back into the current path closes a loop
+                    outc.loop = step in visiting
+                    if step not in visiting and step not in finished:
+                        visiting.add(step)
+                        stack.append((step, enabledOutConnections(step)))
+                        break
+                else:
+                    stack.pop()
+                    visiting.remove(node)
+                    finished.add(node)
+                    postorder.append(node)
+
+        hiddenNodes = set(self.hiddenNodes)
+        order = [x for x in reversed(postorder) if x in hiddenNodes]
+
+        self.forwardPlan = ForwardPlan(
+            self.inputNodes, order, self.outputNodes, self.activation)
+        return self.forwardPlan
+
     def forwardProp(self, signals):
+        """
+        propagate signals through this topology using the compiled ForwardPlan.
+        loop connections carry the signal of the previous forward propagation.
+        PARAMETERS:
+            signals: a list of input signals, one for each input Node
+        RETURNS:
+            a list of output signals, one for each output Node
+        """
         assert len(signals) == len(
             self.inputNodes), 'mismatch input tensor size'
 
-        nextNodes = []
-        nodeBuffer = []  # TODO: this is a sloppy set
-
-        # TODO: extract loop detection to a separate method?
-        # TODO: is Node timeout deprecated?
-        # nodeTimeout = {}
-        orders = self.processSequences()  # TODO: BUBBLES!!!!
-
-        # NOTE: Overestimate
-        # TODO: DEPRECATED
-        # largestCircle = len(self.inputNodes) + \
-        # len(self.hiddenNodes) + len(self.outputNodes)
-
-        for inode, sig in zip(self.inputNodes, signals):
-            # print('input Node is: {}'.format(inode.nodeId))
-            stepNodes = inode.activate(sig)
-            # prevent reverb in forward prop
-            for step in stepNodes:
-                if step not in nodeBuffer and step not in self.inputNodes:
-                    # let recurrent nodes get reappended and catch loop in
-                    # activation condition
-                    nodeBuffer.append(step)
-
-        # print('entering hidden layer..')
-        while len(nodeBuffer) > 0:
-            # print('STEP FORWARD', [x.nodeId for x in nodeBuffer])
-            for curNode in nodeBuffer:
-
-                stepNodes = curNode.activate(None)
-
-                if curNode not in stepNodes and curNode in nextNodes:
-                    nextNodes.remove(curNode)
-
-                for step in [x for x in stepNodes if x in self.hiddenNodes]:
-                    # TODO: activated condition should be redundant with
-                    # NodeGene.activate method
-                    if step not in nextNodes and step.activated is False:
-                        nextNodes.append(step)
-
-            # loop detection routine
-            if nodeBuffer == nextNodes:
-                # TODO need to check if orders is appropriate
-                unreadyConnections = [x.getUnreadyConnections() for
-                                      x in nodeBuffer]
-                unreadyConnections = [x for y in unreadyConnections for x in y]
-                # add loop attribute to oldest unreadyConnection
-                min([x for x in unreadyConnections],
-                    key=lambda x: orders[x.input] if x.input in
-                                                     self.hiddenNodes else float('inf')).loop = True
-            nodeBuffer.clear()
-            nodeBuffer = nextNodes.copy()
-            nextNodes.clear()
-
-        # harvest output signals
-        outputs = []
-        # print('harvesting output signals..')
-        for onode in self.outputNodes:
+        if self.forwardPlan is None:
+            self.compilePlan()
+        plan = self.forwardPlan
+        activations = {}
+
+        for inode, sig in zip(plan.inputNodes, signals):
+            activeSignal = sig
+            for inc in plan.incoming[inode]:
+                # passively accept loop signals to input
+                if inc.signal is not None:
+                    activeSignal += inc.signal
+            activations[inode] = plan.activations[inode][0](activeSignal)
+
+        for node in plan.order + plan.outputNodes:
             activeSignal = 0
-            for inc in [x for x in onode.inConnections if x.disabled is False]:
-                if inc.loop is True and inc.signal is None:
-                    continue
-                else:
+            for inc in plan.incoming[node]:
+                if inc.loop is False:
+                    activeSignal += activations[inc.input] * inc.weight
+                elif inc.signal is not None:
                     activeSignal += inc.signal * inc.weight
-                    # inc.signal = None
-            activeSignal = softmax(activeSignal)
-            outputs.append(activeSignal)
-
-        self.resetNodes()
-        # hacky resetSignals that keep recurrence
-        for x in self.getAllConnections():
-            if x.loop is False:
-                x.signal = None
+            activations[node] = plan.activations[node][0](activeSignal)
+
+        # carry recurrent signals to the next forward propagation
+        for loop in plan.recurrent:
+            loop.signal = activations.get(loop.input)
+
+        return [activations[x] for x in plan.outputNodes]
+
+    def forwardPropBatch(self, inputs):
+        """
+        propagate a batch of input vectors through this topology in one vectorized
+        pass. each row is evaluated from the current recurrent signals of this Genome,
+        which are left untouched (rows do not carry recurrence into each other).
+        PARAMETERS:
+            inputs: array of shape [n_samples, n_inputs]
+        RETURNS:
+            array of output signals of shape [n_samples, n_outputs]
+        """
+        inputs = np.asarray(inputs, dtype=float)
+        assert inputs.ndim == 2 and inputs.shape[1] == len(
+            self.inputNodes), 'mismatch input tensor size'
+
+        if self.forwardPlan is None:
+            self.compilePlan()
+        plan = self.forwardPlan
+        activations = np.empty((inputs.shape[0], len(plan.nodeIndex)))
+
+        for column, inode in enumerate(plan.inputNodes):
+            activeSignal = inputs[:, column]
+            for inc in plan.incoming[inode]:
+                # passively accept loop signals to input
+                if inc.signal is not None:
+                    activeSignal = activeSignal + inc.signal
+            activations[:, column] = plan.activations[inode][1](activeSignal)
+
+        for node in plan.order + plan.outputNodes:
+            weights = np.array(
+                [x.weight for x in plan.incoming[node] if x.loop is False])
+            recurrentSignal = sum(x.signal * x.weight for x in plan.incoming[node]
+                                  if x.loop is True and x.signal is not None)
+            activations[:, plan.nodeIndex[node]] = plan.activations[node][1](
+                activations[:, plan.sources[node]] @ weights + recurrentSignal)
+
+        return activations[:, [plan.nodeIndex[x] for x in plan.outputNodes]]
+
+    def forwardPropSequence(self, inputs, reset=True):
+        """
+        propagate a sequence of input vectors through this topology, carrying
+        recurrent signals from each timestep to the next in a preallocated state
+        array. the final recurrent signals are kept on the loop connections so
+        forwardProp and later sequences continue from them.
+        PARAMETERS:
+            inputs: array of shape [timesteps, n_inputs]
+            reset: start from cleared recurrent signals (see resetSignals) instead
+                   of carrying the signals of the previous forward propagation
+        RETURNS:
+            array of output signals of shape [timesteps, n_outputs]
+        """
+        if reset is True:
+            self.resetSignals()
+
+        engine = PopulationEngine([self])
+        outputs = engine.forwardPropSequence(inputs)[0]
+
+        plan = self.forwardPlan
+        for loop in plan.recurrent:
+            loop.signal = float(engine.state[plan.nodeIndex[loop.input]])
 
         return outputs
 
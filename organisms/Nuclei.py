@@ -70,6 +70,7 @@ def inheritDisjointConnections(
     elif lessFitNode is None:
         inheritIns = moreFitNode.inConnections
         inheritOuts = moreFitNode.outConnections
+        targetNode.activation = moreFitNode.activation
         # fitDisjoint = True
     else:
         # inherit matching genes
@@ -80,9 +81,11 @@ def inheritDisjointConnections(
         if rand.uniform(0, 1) > 0.5:
             inheritOuts = moreFitNode.outConnections
             inheritIns = moreFitNode.inConnections
+            targetNode.activation = moreFitNode.activation
         else:
             inheritOuts = lessFitNode.outConnections
             inheritIns = lessFitNode.inConnections
+            targetNode.activation = lessFitNode.activation
 
     # inherit outConnections
     for outc in inheritOuts:
@@ -110,6 +113,7 @@ def inheritExcessConnections(
 
     if excessParentNode is None:
         return
+    targetNode.activation = excessParentNode.activation
 
     # print('targeting outConnection excess inheritance')
     for outc in excessParentNode.outConnections:
@@ -237,7 +241,7 @@ class Nuclei:
         alignmentOffset = len(moreFitGenes) - len(lessFitGenes)
 
         child = Genome(len(moreFitParent.inputNodes), len(
-            moreFitParent.outputNodes), globalInnovations)
+            moreFitParent.outputNodes), globalInnovations, moreFitParent.activation)
 
         # get initial topology connections
         for inode in child.inputNodes:
@@ -0,0 +1,203 @@
+import numpy as np
+
+
+def groupActivations(activations):
+    """
+    group column positions by their batch activation function
+    RETURNS:
+        a list of (batch activation, column positions) pairs
+    """
+    groups = {}
+    for position, activation in enumerate(activations):
+        groups.setdefault(activation, []).append(position)
+    return [(x, np.array(groups[x], dtype=np.intp)) for x in groups]
+
+
+def packEdges(sources, weights):
+    """
+    pack per destination lists of source columns and weights into a segmented edge
+    list for np.add.reduceat
+    RETURNS:
+        (connected mask, segment starts, source columns, weights)
+    """
+    counts = np.array([len(x) for x in sources], dtype=np.intp)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.intp)
+    return (counts > 0, starts[counts > 0],
+            np.array([x for y in sources for x in y], dtype=np.intp),
+            np.array([x for y in weights for x in y], dtype=float))
+
+
+def segmentSum(signals, edges, width):
+    """
+    sum weighted source signals into their destinations
+    PARAMETERS:
+        signals: array of shape [rows, columns]
+        edges: a segmented edge list from packEdges
+        width: number of destinations
+    RETURNS:
+        array of shape [rows, width]
+    """
+    connected, starts, sources, weights = edges
+    activeSignals = np.zeros((signals.shape[0], width))
+    if len(sources) > 0:
+        activeSignals[:, connected] = np.add.reduceat(
+            signals[:, sources] * weights, starts, axis=1)
+    return activeSignals
+
+
+class PopulationEngine:
+    """
+    packs the ForwardPlans of a population of genomes into one block-diagonal sparse
+    weight structure so every Genome is evaluated on the same input batch at once,
+    layer by layer. weights and recurrent signals are snapshot on construction,
+    rebuild the engine after mutation or crossover.
+
+    Parameters:
+        genomes: list of genomes sharing the same input and output dimensions
+    Constructs:
+        layers: per feed forward depth, the (destination columns, feed forward edges,
+                recurrent edges, activation groups) of every Node in that depth across
+                all genomes. edges are segmented by destination column (see packEdges)
+        state: previous activation of every column, read by recurrent edges
+    """
+
+    def __init__(self, genomes):
+        self.genomeCount = len(genomes)
+        self.inputSize = len(genomes[0].inputNodes)
+        self.outputSize = len(genomes[0].outputNodes)
+
+        inputColumns = []
+        inputRecurrentSources = []
+        inputActivations = []
+        outputColumns = []
+        stateColumns = []
+        stateSignals = []
+        # depth: (destinations, sources, weights, recurrentSources, recurrentWeights,
+        #         activations)
+        depthEdges = {}
+        offset = 0
+        for genome in genomes:
+            assert len(genome.inputNodes) == self.inputSize and \
+                len(genome.outputNodes) == self.outputSize, \
+                'mismatch genome dimensions in population'
+            if genome.forwardPlan is None:
+                genome.compilePlan()
+            plan = genome.forwardPlan
+
+            for loop in plan.recurrent:
+                if loop.signal is not None:
+                    stateColumns.append(offset + plan.nodeIndex[loop.input])
+                    stateSignals.append(loop.signal)
+
+            depths = {}
+            for inode in plan.inputNodes:
+                depths.update({inode: 0})
+                inputColumns.append(offset + plan.nodeIndex[inode])
+                # passively accept loop signals to input
+                inputRecurrentSources.append(
+                    [offset + plan.nodeIndex[x.input] for x in plan.incoming[inode]])
+                inputActivations.append(plan.activations[inode][1])
+
+            for node in plan.order + plan.outputNodes:
+                feedForward = [x for x in plan.incoming[node] if x.loop is False]
+                recurrent = [x for x in plan.incoming[node] if x.loop is True]
+                depth = 1 + max([depths[x.input] for x in feedForward], default=0)
+                depths.update({node: depth})
+
+                destinations, sources, weights, recurrentSources, recurrentWeights, \
+                    activations = depthEdges.setdefault(depth, ([], [], [], [], [], []))
+                destinations.append(offset + plan.nodeIndex[node])
+                sources.append([offset + x for x in plan.sources[node]])
+                weights.append([x.weight for x in feedForward])
+                recurrentSources.append(
+                    [offset + plan.nodeIndex[x.input] for x in recurrent])
+                recurrentWeights.append([x.weight for x in recurrent])
+                activations.append(plan.activations[node][1])
+
+            outputColumns.append([offset + plan.nodeIndex[x] for x in plan.outputNodes])
+            offset += len(plan.nodeIndex)
+
+        self.columnCount = offset
+        self.inputColumns = np.array(inputColumns, dtype=np.intp)
+        self.inputRecurrentEdges = packEdges(
+            inputRecurrentSources, [[1.0] * len(x) for x in inputRecurrentSources])
+        self.inputActivations = groupActivations(inputActivations)
+        self.outputColumns = np.array(outputColumns, dtype=np.intp)
+
+        self.state = np.zeros(self.columnCount)
+        self.state[np.array(stateColumns, dtype=np.intp)] = stateSignals
+
+        self.layers = []
+        for depth in sorted(depthEdges):
+            destinations, sources, weights, recurrentSources, recurrentWeights, \
+                activations = depthEdges[depth]
+            self.layers.append((
+                np.array(destinations, dtype=np.intp),
+                packEdges(sources, weights),
+                packEdges(recurrentSources, recurrentWeights),
+                groupActivations(activations)))
+
+    def propagate(self, inputs, state):
+        """
+        activate every column once.
+        PARAMETERS:
+            inputs: array of shape [n_samples, n_inputs]
+            state: previous activations of shape [n_samples or 1, n_columns]
+        RETURNS:
+            activations of shape [n_samples, n_columns]
+        """
+        activations = np.zeros((inputs.shape[0], self.columnCount))
+        activeSignals = np.tile(inputs, self.genomeCount) + segmentSum(
+            state, self.inputRecurrentEdges, len(self.inputColumns))
+        for activation, members in self.inputActivations:
+            activations[:, self.inputColumns[members]] = activation(
+                activeSignals[:, members])
+
+        for destinations, feedForwardEdges, recurrentEdges, activationGroups \
+                in self.layers:
+            activeSignals = segmentSum(activations, feedForwardEdges, len(destinations)) + \
+                segmentSum(state, recurrentEdges, len(destinations))
+            for activation, members in activationGroups:
+                activations[:, destinations[members]] = activation(
+                    activeSignals[:, members])
+
+        return activations
+
+    def forwardProp(self, inputs):
+        """
+        propagate a batch of input vectors through every Genome in the population.
+        every row reads the same recurrent state, which is left untouched.
+        PARAMETERS:
+            inputs: array of shape [n_samples, n_inputs]
+        RETURNS:
+            array of output signals of shape [n_genomes, n_samples, n_outputs]
+        """
+        inputs = np.asarray(inputs, dtype=float)
+        assert inputs.ndim == 2 and inputs.shape[1] == self.inputSize, \
+            'mismatch input tensor size'
+
+        activations = self.propagate(inputs, self.state[np.newaxis, :])
+        return activations[:, self.outputColumns].transpose(1, 0, 2)
+
+    def forwardPropSequence(self, inputs):
+        """
+        propagate a sequence of input vectors through every Genome in the population,
+        carrying recurrent signals from each timestep to the next. the final state is
+        kept so consecutive calls continue the sequence.
+        PARAMETERS:
+            inputs: array of shape [timesteps, n_inputs]
+        RETURNS:
+            array of output signals of shape [n_genomes, timesteps, n_outputs]
+        """
+        inputs = np.asarray(inputs, dtype=float)
+        assert inputs.ndim == 2 and inputs.shape[1] == self.inputSize, \
+            'mismatch input tensor size'
+
+        outputs = np.empty((inputs.shape[0],) + self.outputColumns.shape)
+        state = self.state[np.newaxis, :]
+        for step in range(inputs.shape[0]):
+            state = self.propagate(inputs[step:step + 1], state)
+            outputs[step] = state[0, self.outputColumns]
+        self.state = state[0]
+
+        return outputs.transpose(1, 0, 2)
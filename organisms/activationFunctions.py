@@ -1,14 +1,114 @@
 # Defines activation functions consider Maths library
 import math
 
+import numpy as np
 
-# TODO: define in scipy or numpy or something with vectorization unless Cython optimizes appropriately
-#               (starting to sound like benchmark activities..)
+# signals are clipped to this magnitude so exp never overflows
+SIGNAL_LIMIT = 500.0
+# K.Stanley's steepened sigmoid slope
+STEEPENED_SLOPE = 4.9
+# resolution of the piecewise linear sigmoid approximation
+TABLE_LIMIT = 16.0
+TABLE_SIZE = 4097
+_tableSignals = np.linspace(-TABLE_LIMIT, TABLE_LIMIT, TABLE_SIZE)
+_tableActivations = 1.0 / (1.0 + np.exp(-_tableSignals))
+_tableStep = 2 * TABLE_LIMIT / (TABLE_SIZE - 1)
 
 
+# NOTE: every activation comes in a scalar flavour (math module, used by
+#       Genome.forwardProp) and a batch flavour (numpy ufuncs, used by
+#       Genome.forwardPropBatch and PopulationEngine) that agree numerically.
+
 def softmax(signal):
     """
-    currently only supporting softmax
+    numerically stable logistic sigmoid (named softmax for historical reasons)
     """
-    # TODO: adjust inflection points by the softmax (4 or whatever) from k stanley
+    signal = min(max(signal, -SIGNAL_LIMIT), SIGNAL_LIMIT)
     return 1.0 / (1.0 + math.exp(-signal))
+
+
+def softmaxBatch(signals):
+    """
+    vectorized softmax over an array of signals
+    """
+    return 1.0 / (1.0 + np.exp(-np.clip(signals, -SIGNAL_LIMIT, SIGNAL_LIMIT)))
+
+
+def steepenedSigmoid(signal):
+    """
+    K.Stanley's steepened sigmoid 1/(1+e^(-4.9x)), near linear in [-0.5, 0.5]
+    """
+    return softmax(STEEPENED_SLOPE * signal)
+
+
+def steepenedSigmoidBatch(signals):
+    """
+    vectorized steepenedSigmoid over an array of signals
+    """
+    return softmaxBatch(STEEPENED_SLOPE * np.asarray(signals))
+
+
+def fastSoftmax(signal):
+    """
+    piecewise linear lookup table approximation of softmax (saturates outside
+    +-TABLE_LIMIT)
+    """
+    position = (min(max(signal, -TABLE_LIMIT), TABLE_LIMIT) + TABLE_LIMIT) / _tableStep
+    index = min(int(position), TABLE_SIZE - 2)
+    fraction = position - index
+    return float(_tableActivations[index] * (1 - fraction) +
+                 _tableActivations[index + 1] * fraction)
+
+
+def fastSoftmaxBatch(signals):
+    """
+    vectorized fastSoftmax over an array of signals
+    """
+    return np.interp(signals, _tableSignals, _tableActivations)
+
+
+def tanh(signal):
+    """
+    hyperbolic tangent
+    """
+    return math.tanh(signal)
+
+
+def tanhBatch(signals):
+    """
+    vectorized tanh over an array of signals
+    """
+    return np.tanh(signals)
+
+
+def relu(signal):
+    """
+    rectified linear unit
+    """
+    return max(signal, 0.0)
+
+
+def reluBatch(signals):
+    """
+    vectorized relu over an array of signals
+    """
+    return np.maximum(signals, 0.0)
+
+
+# name: (scalar activation, batch activation)
+activations = {
+    'softmax': (softmax, softmaxBatch),
+    'steepenedSigmoid': (steepenedSigmoid, steepenedSigmoidBatch),
+    'fastSoftmax': (fastSoftmax, fastSoftmaxBatch),
+    'tanh': (tanh, tanhBatch),
+    'relu': (relu, reluBatch),
+}
+
+
+def getActivation(name):
+    """
+    get the (scalar, batch) pair of activation functions registered under name
+    """
+    if name not in activations:
+        raise Exception('ERROR: unknown activation function ', name)
+    return activations[name]
@@ -2,7 +2,7 @@ from setuptools import setup, find_packages
 
 setup(name='Nodal_NEAT',
       packages=find_packages(),
-      install_requires=['graphviz', 'matplotlib'],
+      install_requires=['graphviz', 'matplotlib', 'numpy'],
       version='1.0.0'
       )
 # TODO: wheel in graphviz backend
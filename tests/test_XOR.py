@@ -1,11 +1,10 @@
 import logging
 import os
-import random as rand
 import re
 import unittest
-from math import sqrt
 
 import matplotlib.pyplot as plt
+import numpy as np
 from matplotlib import style
 from organisms.Evaluator import Evaluator
 
@@ -59,22 +58,17 @@ def myFunc(genome):
     takes a Genome returns Genome with fitness associated
     """
     numTries = 50
-    score = 0
 
     # needs to be random to prevent memorizing order of input
-    for _ in range(0, numTries):
-        entry1 = rand.randint(0, 1)
-        entry2 = rand.randint(0, 1)
-
-        output = genome.forwardProp([entry1, entry2])[0]
-        solution = entry1 ^ entry2
-        score += 1 - (sqrt((output - solution)**2))
-        # TODO: dont round? apparantly this is linearly seperable
-        #       because init topology gets >95 with numtries==50
-        # if round(output) == entry1^entry2:
-        #     score+=1
-
-    score = score / numTries
+    entries = np.random.randint(0, 2, size=(numTries, 2))
+    outputs = genome.forwardPropBatch(entries)[:, 0]
+    solutions = entries[:, 0] ^ entries[:, 1]
+    # TODO: dont round? apparantly this is linearly seperable
+    #       because init topology gets >95 with numtries==50
+    # if round(output) == entry1^entry2:
+    #     score+=1
+
+    score = float(np.sum(1 - np.abs(outputs - solutions))) / numTries
     # return score
     genome.fitness = score
     return genome
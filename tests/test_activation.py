@@ -0,0 +1,56 @@
+import unittest
+
+import numpy as np
+
+from organisms.Evaluator import Evaluator
+from organisms.activationFunctions import activations, fastSoftmaxBatch, softmax, softmaxBatch
+
+
+class TestActivation(unittest.TestCase):
+    def test_activationFunctions(self):
+        """
+        scalar and batch activations agree and stay finite for extreme signals.
+        """
+        print('\n TESTING ACTIVATION FUNCTIONS ')
+        signals = np.concatenate((np.linspace(-20, 20, 401), [-1e6, -800, 800, 1e6]))
+        for name in activations:
+            scalar, batch = activations[name]
+            batched = batch(signals)
+            assert np.all(np.isfinite(batched)), '{} overflowed'.format(name)
+            assert np.allclose([scalar(x) for x in signals], batched), \
+                '{} scalar and batch activations disagree'.format(name)
+
+        assert softmax(-1e6) < 1e-200 and softmax(1e6) == 1.0, 'softmax not clipped'
+        assert np.max(np.abs(fastSoftmaxBatch(signals) - softmaxBatch(signals))) < 1e-5, \
+            'lookup table approximation too coarse'
+
+    def test_nodeActivation(self):
+        """
+        per Genome and per Node activation selection is honoured by every forward
+        propagation path.
+        """
+        print('\n TESTING NODE ACTIVATION SELECTION ')
+        evaluation = Evaluator(inputs=2, outputs=2, population=4,
+                               connectionMutationRate=0.3, nodeMutationRate=0.01, weightMutationRate=0.5,
+                               weightPerturbRate=0.9, selectionPressure=3,
+                               activation='steepenedSigmoid')
+        names = list(activations)
+        for test in evaluation.genepool:
+            for _ in range(0, 15):
+                test.addConnectionMutation(0.7, evaluation.globalInnovations)
+                test.addNodeMutation(0.7, evaluation.globalInnovations)
+            for position, node in enumerate(test.hiddenNodes):
+                test.setActivation(names[position % len(names)], node)
+
+        inputs = np.random.uniform(-2, 2, size=(8, 2))
+        population = evaluation.forwardPropPopulation(inputs)
+        for test, outputs in zip(evaluation.genepool, population):
+            assert test.activation == 'steepenedSigmoid'
+            assert np.allclose(test.forwardPropBatch(inputs), outputs)
+            for row, rowOutputs in zip(inputs, outputs):
+                test.resetSignals()
+                assert np.allclose(test.forwardProp(list(row)), rowOutputs)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+
 from organisms.Evaluator import Evaluator
 #@DEPRECATED
 #import uuid
@@ -37,6 +39,129 @@ class TestForwardProp(unittest.TestCase):
 
         #graphvizNEAT(test, 'test-Genome-{}'.format(uuid.uuid1()))
 
+    def test_forwardPlan(self):
+        """
+        the ForwardPlan is compiled once per topology and invalidated by structural
+        changes.
+        """
+        print('\n TESTING FORWARD PLAN CACHING ')
+        evaluation = Evaluator(inputs=2, outputs=2, population=1,
+                               connectionMutationRate=0.3, nodeMutationRate=0.01, weightMutationRate=0.5,
+                               weightPerturbRate=0.9, selectionPressure=3)
+        test = evaluation.genepool[0]
+        for _ in range(0, 20):
+            test.addConnectionMutation(0.9, evaluation.globalInnovations)
+            test.addNodeMutation(0.9, evaluation.globalInnovations)
+
+        assert test.forwardPlan is None, 'mutation did not invalidate forward plan'
+        test.forwardProp([1, 2])
+        plan = test.forwardPlan
+        assert len(plan.order) == len(test.hiddenNodes), 'unscheduled hidden nodes'
+        for _ in range(0, 10):
+            test.forwardProp([1, 2])
+        assert test.forwardPlan is plan, 'forward plan recompiled without structural change'
+
+        # loop connections are exactly the feedback connections of the activation order
+        position = {node: x for x, node in enumerate(
+            plan.inputNodes + plan.order + plan.outputNodes)}
+        for connect in test.getAllConnections():
+            if connect.disabled is False:
+                assert connect.loop is (position[connect.input] >= position[connect.output]), \
+                    'loop classification disagrees with activation order'
+        loops = [x.loop for x in test.getAllConnections()]
+        test.resetLoops()
+        test.compilePlan()
+        assert loops == [x.loop for x in test.getAllConnections()], \
+            'non-deterministic loop classification'
+        assert plan.order == test.forwardPlan.order, 'non-deterministic activation order'
+
+        test.addNode(test.getAllConnections()[0], evaluation.globalInnovations)
+        assert test.forwardPlan is None, 'addNode did not invalidate forward plan'
+        test.forwardProp([1, 2])
+        assert len(test.forwardPlan.order) == len(test.hiddenNodes), 'unscheduled hidden nodes'
+
+    def test_forwardPropBatch(self):
+        """
+        batched forward propagation matches scalar forward propagation from the same
+        recurrent state.
+        """
+        print('\n TESTING BATCHED FORWARD PROPAGATION ')
+        evaluation = Evaluator(inputs=2, outputs=2, population=1,
+                               connectionMutationRate=0.3, nodeMutationRate=0.01, weightMutationRate=0.5,
+                               weightPerturbRate=0.9, selectionPressure=3)
+        test = evaluation.genepool[0]
+        for _ in range(0, 30):
+            test.addConnectionMutation(0.9, evaluation.globalInnovations)
+            test.addNodeMutation(0.9, evaluation.globalInnovations)
+            test.mutateConnectionWeights(0.5, 0.9)
+
+        inputs = np.random.uniform(-2, 2, size=(20, 2))
+        batch = test.forwardPropBatch(inputs)
+        assert batch.shape == (20, 2), 'wrong batch output shape'
+        for row, outputs in zip(inputs, batch):
+            test.resetSignals()
+            assert np.allclose(test.forwardProp(list(row)), outputs), \
+                'batched forward propagation diverged from scalar forward propagation'
+
+
+    def test_forwardPropPopulation(self):
+        """
+        the packed population engine matches batched forward propagation of each
+        Genome.
+        """
+        print('\n TESTING POPULATION FORWARD PROPAGATION ')
+        evaluation = Evaluator(inputs=3, outputs=2, population=20,
+                               connectionMutationRate=0.3, nodeMutationRate=0.01, weightMutationRate=0.5,
+                               weightPerturbRate=0.9, selectionPressure=3)
+        for test in evaluation.genepool:
+            for _ in range(0, 15):
+                test.addConnectionMutation(0.7, evaluation.globalInnovations)
+                test.addNodeMutation(0.7, evaluation.globalInnovations)
+                test.mutateConnectionWeights(0.5, 0.9)
+            # carry some recurrent signals into the evaluation
+            test.forwardProp([0.5, -0.5, 1])
+
+        inputs = np.random.uniform(-2, 2, size=(16, 3))
+        outputs = evaluation.forwardPropPopulation(inputs)
+        assert outputs.shape == (20, 16, 2), 'wrong population output shape'
+        for test, genomeOutputs in zip(evaluation.genepool, outputs):
+            assert np.allclose(test.forwardPropBatch(inputs), genomeOutputs), \
+                'population forward propagation diverged from batched forward propagation'
+
+
+    def test_forwardPropSequence(self):
+        """
+        sequence forward propagation carries recurrence exactly as repeated scalar
+        forward propagation.
+        """
+        print('\n TESTING SEQUENCE FORWARD PROPAGATION ')
+        evaluation = Evaluator(inputs=2, outputs=2, population=1,
+                               connectionMutationRate=0.3, nodeMutationRate=0.01, weightMutationRate=0.5,
+                               weightPerturbRate=0.9, selectionPressure=3)
+        test = evaluation.genepool[0]
+        for _ in range(0, 30):
+            test.addConnectionMutation(0.9, evaluation.globalInnovations)
+            test.addNodeMutation(0.9, evaluation.globalInnovations)
+            test.mutateConnectionWeights(0.5, 0.9)
+
+        inputs = np.random.uniform(-2, 2, size=(25, 2))
+        sequence = test.forwardPropSequence(inputs)
+        assert sequence.shape == (25, 2), 'wrong sequence output shape'
+
+        test.resetSignals()
+        for row, outputs in zip(inputs, sequence):
+            assert np.allclose(test.forwardProp(list(row)), outputs), \
+                'sequence forward propagation diverged from scalar forward propagation'
+
+        # carrying state continues where scalar forward propagation left off
+        carried = test.forwardPropSequence(inputs[:5], reset=False)
+        test.resetSignals()
+        for row in inputs:
+            test.forwardProp(list(row))
+        for row, outputs in zip(inputs[:5], carried):
+            assert np.allclose(test.forwardProp(list(row)), outputs), \
+                'sequence forward propagation did not carry recurrent signals'
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,51 @@
+import pickle
+import unittest
+
+import numpy as np
+
+from organisms.Evaluator import Evaluator
+from organisms.Genome import Genome
+
+
+class TestGeneTable(unittest.TestCase):
+    def test_geneTable(self):
+        """
+        a Genome rebuilt from its GeneTable has the same topology, primal connections
+        and phenotype.
+        """
+        print('\n TESTING GENE TABLE ROUND TRIP ')
+        evaluation = Evaluator(inputs=2, outputs=2, population=1,
+                               connectionMutationRate=0.3, nodeMutationRate=0.01, weightMutationRate=0.5,
+                               weightPerturbRate=0.9, selectionPressure=3)
+        test = evaluation.genepool[0]
+        for _ in range(0, 40):
+            test.addConnectionMutation(0.9, evaluation.globalInnovations)
+            test.addNodeMutation(0.9, evaluation.globalInnovations)
+            test.mutateConnectionWeights(0.5, 0.9)
+        test.setActivation('tanh', test.hiddenNodes[0])
+        test.fitness = 0.5
+
+        table = test.geneTable()
+        assert np.all(np.diff(table.connections['innovation']) >= 0), 'genes not sorted by innovation'
+        print('gene table bytes: {} pickled object graph bytes: {}'.format(
+            table.nbytes, len(pickle.dumps((test.inputNodes, test.outputNodes, test.hiddenNodes)))))
+
+        rebuilt = Genome.fromGeneTable(table)
+        assert rebuilt.fitness == test.fitness and rebuilt.activation == test.activation
+        for nodes, rebuiltNodes in ((test.inputNodes, rebuilt.inputNodes),
+                                    (test.outputNodes, rebuilt.outputNodes),
+                                    (test.hiddenNodes, rebuilt.hiddenNodes)):
+            assert [x.nodeId for x in nodes] == [x.nodeId for x in rebuiltNodes]
+            for node, rebuiltNode in zip(nodes, rebuiltNodes):
+                assert node.activation == rebuiltNode.activation
+                assert [x.innovation for x in node.inConnections] == \
+                    [x.innovation for x in rebuiltNode.inConnections], 'inConnection order lost'
+                assert [x.innovation for x in node.outConnections] == \
+                    [x.innovation for x in rebuiltNode.outConnections], 'outConnection order lost'
+
+        inputs = np.random.uniform(-2, 2, size=(10, 2))
+        assert np.allclose(test.forwardPropSequence(inputs), rebuilt.forwardPropSequence(inputs))
+
+
+if __name__ == '__main__':
+    unittest.main()